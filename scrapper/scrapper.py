@@ -17,25 +17,32 @@ Dependencies:
 - os: For file and directory operations.
 - datetime: For working with dates and times.
 - RPA.Excel.Files: For working with Excel files.
-- RPA.Browser.Selenium: For browser automation using Selenium.
-- selenium.webdriver.common.by: For locating elements by various strategies.
-- selenium.webdriver.support.ui: For waiting until conditions are met.
-- selenium.webdriver.support.expected_conditions: For defining expected conditions.
+- robocorp.browser: For browser automation using Playwright.
+- lxml: For parsing the page source and extracting article fields.
 
-Note: This module requires the 'locators' module to define the locators for various elements on the target website.
+Note: This module requires the 'locators' module to define the selectors for various elements on the target website.
 """
 import logging
 import re
 import requests
 import os
+import threading
+import time
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime as dt
+from queue import Queue
+
+from dateutil.relativedelta import relativedelta
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from lxml import etree
+from lxml import html as lxml_html
 
 from RPA.Excel.Files import Files
-from RPA.Browser.Selenium import Selenium, WebElement
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from robocorp import browser
 
 from .locators import (
     ENABLE_SEARCH_BUTTON_BIG,
@@ -52,6 +59,22 @@ from .locators import (
     NEWS_IMAGE_CLASS
 )
 
+_ARTICLES_XP = etree.XPath('//*[@id="main-content-area"]/div[2]/div[2]/article')
+_TITLE_XP = etree.XPath(f"string(.//*[contains(@class, '{NEWS_TITLE_CLASS.lstrip('.')}')])")
+_DESCRIPTION_XP = etree.XPath(f"string(.//*[contains(@class, '{NEWS_DESCRIPTION_CLASS.lstrip('.')}')])")
+_FOOTER_XP = etree.XPath(f"string(.//*[contains(@class, '{NEWS_FOOTER_CLASS.lstrip('.')}')])")
+_IMG_SRC_XP = etree.XPath(f".//img[contains(@class, '{NEWS_IMAGE_CLASS.lstrip('.')}')]/@src")
+
+_MAX_DOWNLOAD_WORKERS = 16
+
+# Queue sentinel telling the Excel writer to exit without saving the workbook.
+_ABORT_ROW = object()
+
+_MONEY_RE = re.compile(
+    r'\$\d+(?:,\d{3})*(?:\.\d{1,2})?|\b\d+(?:,\d{3})*\s+(?:dollars|USD)\b'
+)
+_DATE_RE = re.compile(r'(?:Published On|Last update) (\d{1,2} \w{3} \d{4})')
+
 
 class MainScrapper():
     """
@@ -61,16 +84,18 @@ class MainScrapper():
         target_url (str): The URL of the website to scrape.
         number_of_months (int): The range of months to consider for the news articles.
         search_phrase (str): The term to search for in the news articles.
-        browser (Selenium): An instance of the Selenium browser for web scraping.
-        month_limit (int): The limit of months for filtering news articles.
-        window_size (tuple): The size of the browser window.
+        page (Page): The Playwright page used for web scraping.
+        _cutoff (datetime): The oldest publication date to keep when filtering news articles.
+        window_size (tuple): The size of the browser viewport.
+        excel_path (str): The path of the Excel file to write.
         img_directory (str): The directory to save downloaded images.
     """
     def __init__(
         self,
         target_url='https://www.aljazeera.com/',
         number_of_months=0,
-        search_phrase=None
+        search_phrase=None,
+        output_name='output'
     ):
         """
         Initialize the MenuScrapper with a target URL, time range, and search term.
@@ -79,17 +104,35 @@ class MainScrapper():
             target_url (str): The URL of the website to scrape. Defaults to 'https://www.aljazeera.com/'.
             number_of_months (int): The range of months to consider for the news articles. Defaults to 1.
             search_phrase (str): The term to search for in the news articles. Defaults to None.
+            output_name (str): The base name of this run's output file and image directory,
+                so parallel runs do not overwrite each other. Defaults to 'output'.
         """
-        self.browser = Selenium()
-        self.month_limit = dt.now().month - max(number_of_months - 1, 0)
+        browser.configure(headless=True)
+        self.page = browser.goto(target_url)
+        self.page.set_default_timeout(3000)
+        self._cutoff = (
+            dt.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            - relativedelta(months=max(number_of_months - 1, 0))
+        )
 
         self.search_phrase = search_phrase
-
-        self.browser.open_available_browser(url=target_url, headless=True)
-        self.browser.set_selenium_implicit_wait(3)
-
-        self.window_size = self.browser.get_window_size()
-        self.img_directory = 'output/imgs'
+        self._term_re = re.compile(re.escape(search_phrase), re.IGNORECASE) if search_phrase else None
+
+        viewport = self.page.viewport_size or {'width': 1280, 'height': 720}
+        self.window_size = (viewport['width'], viewport['height'])
+        self.excel_path = os.path.join('output', f'{output_name}.xlsx')
+        self.img_directory = os.path.join('output', 'imgs', output_name)
+        os.makedirs(self.img_directory, exist_ok=True)
+
+        self._session = requests.Session()
+        self._session.mount(
+            'https://',
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=_MAX_DOWNLOAD_WORKERS,
+                max_retries=Retry(total=2, backoff_factor=0.2)
+            )
+        )
 
     def scrape(self) -> None:
         """
@@ -101,30 +144,41 @@ class MainScrapper():
         Returns:
             None
         """
+        rows = Queue()
+        writer_errors = []
+        writer = threading.Thread(
+            target=self._excel_writer,
+            args=(rows, self.excel_path, writer_errors)
+        )
+        writer.start()
+
+        failed = False
+
         try:
             self.search_news()
 
-            WebDriverWait(self.browser.driver, 2).until(
-                EC.presence_of_element_located((By.ID, 'search-sort-option'))
-            )
-
-            self.save_payload_to_excel(
-                self.process_news_payload(
-                    news_list=self.get_news_list_by_date()
-                )
+            self.process_news_payload(
+                news_list=self.get_news_list_by_date(),
+                rows=rows
             )
 
         except Exception as error:
+            failed = True
             logging.error(
                 f'Unexpected error while trying to perform scraping: {error}'
             )
-            self.browser.close_all_browsers()
             raise Exception from error
 
         finally:
-            self.browser.close_all_browsers()
+            rows.put(_ABORT_ROW if failed else None)
+            writer.join()
+            self._session.close()
+            browser.context().close()
 
-    def get_news_image(self, img_src: str, idx: int) -> str:
+        if writer_errors:
+            raise writer_errors[0]
+
+    def _fetch_and_write(self, img_src: str, idx: int) -> str:
         """
         Download a news image from the given source URL and return the file name.
 
@@ -135,133 +189,186 @@ class MainScrapper():
         Returns:
             str: The file name of the downloaded image.
         """
-        if not os.path.exists(self.img_directory):
-            os.makedirs(self.img_directory)
-            logging.info('-- Image directory created')
-        
-        resp = requests.get(img_src, timeout=1.5)
+        try:
+            with self._session.get(img_src, timeout=1.5, stream=True) as resp:
+                if resp.status_code == 200:
+                    img_file_name = f'img_{idx}.png'
 
-        if resp.status_code == 200:
-            img_file_name = f'img_{idx}.png'
+                    with open(os.path.join(self.img_directory, img_file_name), 'wb') as f:
+                        for chunk in resp.iter_content(chunk_size=65536):
+                            f.write(chunk)
 
-            with open(f'output/imgs/{img_file_name}', 'wb') as f:
-                f.write(resp.content)
-                logging.info(f'-- Image {img_file_name} saved')
+                        logging.info(f'-- Image {img_file_name} saved')
+
+                else:
+                    logging.warning(
+                        f'-- Unable to fetch image from source: {resp.status_code}'
+                    )
+                    img_file_name = 'Unavailable'
+
+        except (requests.RequestException, OSError) as error:
+            logging.warning(f'-- Unable to fetch image from source: {error}')
+            return 'Unavailable'
 
-        else:
-            logging.warning(
-                f'-- Unable to fetch image from source: {resp.status_code} {resp.content}'
-            )
-            img_file_name = 'Unavailable'
-        
         return img_file_name
 
     def search_news(self) -> None:
         """
         Perform a search on the target website using the specified search term.
         """
-        self.browser.set_window_size(*self.window_size)
+        if self.window_size[0] > 992:
+            self.page.click(ENABLE_SEARCH_BUTTON_BIG)
+            self.page.fill(SEARCH_INPUT_BIG, self.search_phrase)
 
-        if self.browser.get_window_size()[0] > 992:
-            self.browser.click_element(ENABLE_SEARCH_BUTTON_BIG)
-            self.browser.input_text(SEARCH_INPUT_BIG, self.search_phrase)
-        
         else:
-            self.browser.click_element(ENABLE_SEARCH_BUTTON_SMALL)
-            self.browser.input_text(SEARCH_INPUT_SMALL, self.search_phrase)
+            self.page.click(ENABLE_SEARCH_BUTTON_SMALL)
+            self.page.fill(SEARCH_INPUT_SMALL, self.search_phrase)
 
-        self.browser.click_button(SEARCH_BUTTON_ID)
+        self.page.click(SEARCH_BUTTON_ID)
 
-    def get_news_list_by_date(self) -> list[WebElement]:
+    def get_news_list_by_date(self) -> list[dict]:
         """
         Get a list of news articles sorted by date from the target website.
 
         Returns:
-            list: A list of Selenium web elements representing the news articles.
+            list of dict: A list of dictionaries with the raw title, description,
+            footer and image source of each news article.
         """
-        self.browser.select_from_list_by_value(SEARCH_SORT_OPTIONS, 'date')
-
-        WebDriverWait(self.browser.driver, 3).until(
-            EC.presence_of_element_located((By.XPATH, MAIN_CONTENT.replace('xpath:', '')))
+        self.page.select_option(SEARCH_SORT_OPTIONS, 'date')
+
+        self.page.wait_for_selector(MAIN_CONTENT)
+
+        load_more_js = (
+            "() => {"
+            f"var b = document.querySelector('{LOAD_MODE_BUTTON}');"
+            "if (!b) return false;"
+            "window.scrollTo(0, document.body.scrollHeight);"
+            "b.click();"
+            "return true;"
+            "}"
         )
 
-        while self.browser.does_page_contain_element(LOAD_MODE_BUTTON):
-            self.browser.execute_javascript("window.scrollTo(0, document.body.scrollHeight);")
-            self.browser.click_element(LOAD_MODE_BUTTON)
+        while self.page.evaluate(load_more_js):
+            time.sleep(0.4)
+
+        tree = lxml_html.fromstring(self.page.content())
+        tree.make_links_absolute(self.page.url)
 
-        return self.browser.find_elements(MAIN_CONTENT)
+        return [
+            {
+                'title': _TITLE_XP(article).strip(),
+                'description': _DESCRIPTION_XP(article).strip(),
+                'footer': _FOOTER_XP(article).strip(),
+                'img_src': next(iter(_IMG_SRC_XP(article)), None)
+            }
+            for article in _ARTICLES_XP(tree)
+        ]
 
-    def process_news_payload(self, news_list: list[WebElement]) -> list[dict]:
+    def process_news_payload(self, news_list: list[dict], rows: Queue) -> list[dict]:
         """
         Process the list of news articles and return the data payload.
 
+        Each processed article is pushed to the rows queue as soon as its image
+        download resolves, so the Excel writer thread can overlap disk I/O with
+        the remaining downloads.
+
         Args:
-            news_list (list): A list of Selenium web elements representing the news articles.
+            news_list (list): A list of dictionaries with the raw fields of each news article.
+            rows (Queue): The queue consumed by the Excel writer thread.
 
         Returns:
             list of dict: A list of dictionaries containing the processed news data.
         """
         _news_payload = []
+        pending = []
 
-        for i, element in enumerate(news_list):
+        for i, article in enumerate(news_list):
             try:
-                title = self.browser.find_element(NEWS_TITLE_CLASS, parent=element).text
-                description = self.browser.find_element(NEWS_DESCRIPTION_CLASS, parent=element).text.split('...')
-                description = description[len(description) - 2].strip()
-                date = self.convert_string_to_datetime(
-                    self.browser.find_element(locator=NEWS_FOOTER_CLASS, parent=element).text
-                )
-
-                if date:
-                    if date.month >= self.month_limit:
-                        _news_payload.append(
-                            {
-                                'title': title,
-                                'date': date.strftime('%d %b %Y'),
-                                'description': description,
-                                'search_term_occurrence': title.count(self.search_phrase) + description.count(self.search_phrase),
-                                'contains_money': self.contains_money(title) or self.contains_money(description),
-                                'img_file_name': self.get_news_image(
-                                    img_src=self.browser.find_element(NEWS_IMAGE_CLASS, parent=element).get_attribute('src'),
-                                    idx=i
-                                )
-                            }
-                        )
-                    else:
-                        break
+                date = self.convert_string_to_datetime(article['footer'])
+
+                if not date or date < self._cutoff:
+                    continue
+
+                title = article['title']
+                raw_desc = article['description']
+                description = raw_desc.rsplit('...', 2)[-2].strip() if '...' in raw_desc else raw_desc.strip()
+
+                partial = {
+                    'title': title,
+                    'date': date.strftime('%d %b %Y'),
+                    'description': description,
+                    'search_term_occurrence': (
+                        len(self._term_re.findall(title)) + len(self._term_re.findall(description))
+                    ) if self._term_re else 0,
+                    'contains_money': self.contains_money(title) or self.contains_money(description),
+                    'img_file_name': 'Unavailable'
+                }
+                _news_payload.append(partial)
+
+                if article['img_src']:
+                    pending.append((i, article['img_src'], partial))
+                else:
+                    rows.put(partial)
 
             except Exception as error:
                 logging.warning(f'-- Error while processing news element {error}')
 
+        if pending:
+            def _enqueue_row(partial):
+                def callback(future):
+                    partial['img_file_name'] = future.result()
+                    rows.put(partial)
+
+                return callback
+
+            with ThreadPoolExecutor(max_workers=_MAX_DOWNLOAD_WORKERS) as executor:
+                for idx, img_src, partial in pending:
+                    future = executor.submit(self._fetch_and_write, img_src, idx)
+                    future.add_done_callback(_enqueue_row(partial))
+
         return _news_payload
 
     @staticmethod
-    def save_payload_to_excel(payload: list[dict]) -> None:
+    def _excel_writer(rows: Queue, file_name: str, errors: list) -> None:
         """
-        Save the processed news data to an Excel file.
+        Consume processed news rows from the queue and write them to an Excel file.
+
+        Runs in a background thread so workbook writes overlap with the image
+        downloads still in flight. A None sentinel on the queue ends the loop
+        and saves the workbook; the _ABORT_ROW sentinel ends it without
+        saving, leaving any previous output file untouched. Exceptions are
+        appended to the errors list so scrape() can re-raise them after the
+        thread is joined.
 
         Args:
-            payload (list of dict): The list of dictionaries containing the processed news data.
+            rows (Queue): The queue of processed news dictionaries.
+            file_name (str): The path of the Excel file to write.
+            errors (list): The list collecting exceptions raised in this thread.
         """
-        excel = Files()
-        file_name = 'output/output.xlsx'
-
-        if not os.path.exists(file_name):
+        try:
+            excel = Files()
             excel.create_workbook(file_name)
-        else:
-            excel.open_workbook(file_name)
 
-        keys = payload[0].keys()
+            header_written = False
+
+            while True:
+                row = rows.get()
+
+                if row is _ABORT_ROW:
+                    return
 
-        for col_num, key in enumerate(keys, start=1):
-            excel.set_cell_value(1, col_num, key)
+                if row is None:
+                    break
 
-        for row_num, dictionary in enumerate(payload, start=2):
-            for col_num, (key, value) in enumerate(dictionary.items(), start=1):
-                excel.set_cell_value(row_num, col_num, value)
+                excel.append_rows_to_worksheet([row], header=not header_written)
+                header_written = True
 
-        excel.save_workbook(file_name)
-        excel.close_workbook()
+            excel.save_workbook(file_name)
+            excel.close_workbook()
+
+        except Exception as error:
+            logging.error(f'Unexpected error while writing the Excel file: {error}')
+            errors.append(error)
 
     @staticmethod
     def contains_money(text: str) -> bool:
@@ -274,17 +381,10 @@ class MainScrapper():
         Returns:
             bool: True if the text contains monetary values, False otherwise.
         """
-        patterns = [
-            r'\$\d+(?:,\d{3})*(?:\.\d{1,2})?',
-            r'\b\d+(?:,\d{3})*\s+dollars\b',
-            r'\b\d+(?:,\d{3})*\s+USD\b'
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, text):
-                return True
-        
-        return False
+        if '$' not in text and not any(ch.isdigit() for ch in text):
+            return False
+
+        return _MONEY_RE.search(text) is not None
 
     @staticmethod
     def convert_string_to_datetime(date_string: str) -> dt:
@@ -297,18 +397,13 @@ class MainScrapper():
         Returns:
             datetime: The converted datetime object, or None if the conversion fails.
         """        
-        date_patterns = [
-            r'Published On (\d{1,2} \w{3} \d{4})',
-            r'Last update (\d{1,2} \w{3} \d{4})'
-        ]
+        match = _DATE_RE.search(date_string)
+
+        if match:
+            try:
+                return dt.strptime(match.group(1), '%d %b %Y')
+
+            except ValueError as e:
+                logging.warning(f"Error parsing date: {e}")
 
-        if date_string.strip():
-            for pattern in date_patterns:
-                match = re.search(pattern, date_string)
-                if match:
-                    try:
-                        return dt.strptime(match.group(1), '%d %b %Y')
-                    
-                    except ValueError as e:
-                        logging.warning(f"Error parsing date: {e}")
-                return None
+        return None
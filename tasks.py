@@ -1,9 +1,10 @@
 """
 This script contains the main task for running the news scraper robot.
-It retrieves work item variables, initializes the MainScrapper with these variables,
-and executes the scraping process.
+It reserves each input work item in turn, scrapes it in a dedicated
+worker process, and reports the item done or failed from the result.
 """
 import logging
+import multiprocessing
 
 from robocorp.tasks import task
 from robocorp import workitems
@@ -11,14 +12,38 @@ from robocorp import workitems
 from scrapper import MainScrapper
 
 
+def _run_scrape(payload: dict) -> str | None:
+    """
+    Run one scrape in a worker process.
+
+    Each process gets its own MainScrapper, and with it its own browser,
+    since the browser automation layer is not thread-safe.
+
+    Args:
+        payload (dict): The work item variables for the MainScrapper.
+
+    Returns:
+        str: The error message if the scrape failed, or None on success.
+    """
+    try:
+        MainScrapper(**payload).scrape()
+
+    except Exception as error:
+        logging.error(f'-- Work item scrape failed: {error}')
+        return str(error)
+
+    return None
+
+
 @task
 def minimal_task():
     """
     The main task function for the news scraper robot.
-    
-    This function sets up logging, retrieves input work item variables, initializes
-    the MainScrapper with these variables, and runs the scrape method. It logs the 
-    start and end of the scraping process.
+
+    This function sets up logging and processes the input work items one at a
+    time, scraping each in its own worker process. Only one work item is
+    reserved at any moment, and it is released as done or failed once its
+    scrape result is known. It logs the start and end of the scraping process.
 
     Returns:
         None
@@ -30,7 +55,17 @@ def minimal_task():
     )
 
     logging.info('-- Starting Up Scrapper')
-    with workitems.inputs.current as item:
-        MainScrapper(**item.payload).scrape()
+
+    with multiprocessing.Pool(processes=1, maxtasksperchild=1) as pool:
+        for i, item in enumerate(workitems.inputs):
+            payload = dict(item.payload)
+            payload['output_name'] = f'output_{i}'
+
+            error = pool.apply(_run_scrape, (payload,))
+
+            if error is None:
+                item.done()
+            else:
+                item.fail(message=error)
 
     logging.info('-- Scrapper finished')